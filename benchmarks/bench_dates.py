@@ -0,0 +1,91 @@
+"""
+Benchmark timestamp conversion for a large Notion result page.
+
+Compares the previous per-row pytz path (`fromisoformat(...).astimezone(JST)`
+for the Date start and created_time of every row) with the zoneinfo layer in
+`notion_mcp.api.utils` as `fetch_todos` uses it: Date values, which repeat
+across rows, go through the `parse_notion_date` cache, while unique
+created_time values are parsed directly. Requires pytz for the baseline.
+
+    python benchmarks/bench_dates.py --rows 5000
+"""
+import argparse
+import os
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("NOTION_API_KEY", "bench")
+os.environ.setdefault("NOTION_TODO_DATABASE_ID", "todo-db")
+os.environ.setdefault("NOTION_PROJECT_DATABASE_ID", "project-db")
+os.environ.setdefault("TZ", "Asia/Tokyo")
+
+import pytz  # noqa: E402
+
+from notion_mcp.api.parsers import parse_date_end_property, parse_date_property  # noqa: E402
+from notion_mcp.api.utils import parse_notion_date, parse_notion_datetime  # noqa: E402
+
+
+def make_page(rows: int, distinct_dates: int) -> list:
+    rng = random.Random(29)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    starts = [base + timedelta(hours=rng.randint(0, 24 * 365)) for _ in range(distinct_dates)]
+    page = []
+    for i in range(rows):
+        start = rng.choice(starts)
+        page.append({
+            "id": f"todo-{i}",
+            "created_time": (base + timedelta(seconds=i * 37)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "properties": {
+                "Date": {"date": {
+                    "start": start.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                    "end": (start + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                }},
+            },
+        })
+    return page
+
+
+def old_pytz(page: list, tz):
+    for item in page:
+        date_data = item["properties"]["Date"]["date"]
+        datetime.fromisoformat(date_data["start"].replace("Z", "+00:00")).astimezone(tz)
+        datetime.fromisoformat(item["created_time"].replace("Z", "+00:00")).astimezone(tz)
+
+
+def new_zoneinfo(page: list, cold: bool):
+    if cold:
+        parse_notion_date.cache_clear()
+    for item in page:
+        props = item["properties"]
+        parse_date_property(props, "Date")
+        parse_date_end_property(props, "Date")
+        parse_notion_datetime(item["created_time"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--distinct-dates", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    page = make_page(args.rows, args.distinct_dates)
+    tz = pytz.timezone(os.environ["TZ"])
+
+    cases = [
+        ("pytz per row (start + created)", lambda: old_pytz(page, tz)),
+        ("zoneinfo, cold cache (start + end + created)", lambda: new_zoneinfo(page, cold=True)),
+        ("zoneinfo, warm cache (start + end + created)", lambda: new_zoneinfo(page, cold=False)),
+    ]
+    print(f"{args.rows} rows, {args.distinct_dates} distinct Date values, best of {args.repeat}")
+    baseline = None
+    for name, fn in cases:
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"  {name:55s} {best * 1000:8.2f} ms  "
+              f"({best / args.rows * 1e6:.2f} us/row, {baseline / best:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark concurrent MCP sessions served by one SSE process.
+
+Starts `run_sse` in-process with Notion mocked by `httpx.MockTransport`,
+opens N concurrent client sessions, holds them all open, then has every
+session call `show_specific_date_todos`. Reports how many sessions the
+process held, connect and tool-call latency, and how many requests
+actually reached (mocked) Notion thanks to the shared query cache.
+
+    python benchmarks/bench_sse_sessions.py --sessions 200
+"""
+import argparse
+import asyncio
+import logging
+import os
+import resource
+import socket
+import statistics
+import time
+
+os.environ.setdefault("NOTION_API_KEY", "bench")
+os.environ.setdefault("NOTION_TODO_DATABASE_ID", "todo-db")
+os.environ.setdefault("NOTION_PROJECT_DATABASE_ID", "project-db")
+os.environ.setdefault("TZ", "Asia/Tokyo")
+
+import httpx  # noqa: E402
+from mcp import ClientSession  # noqa: E402
+from mcp.client.sse import sse_client  # noqa: E402
+
+
+def _page(rows: int) -> dict:
+    return {
+        "results": [{
+            "id": f"todo-{i}",
+            "created_time": "2024-05-01T00:00:00.000Z",
+            "properties": {
+                "Task": {"title": [{"text": {"content": f"Task {i}"}}]},
+                "Done": {"checkbox": False},
+                "Date": {"date": {"start": "2024-05-02T01:00:00.000Z",
+                                  "end": "2024-05-02T02:00:00.000Z"}},
+            },
+        } for i in range(rows)],
+        "has_more": False,
+        "next_cursor": None,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def _wait_for_port(port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.05)
+    raise RuntimeError(f"SSE server did not start on port {port}")
+
+
+async def run(sessions: int, notion_latency: float, distinct_queries: int, rows: int):
+    from notion_mcp.api.notion import NotionClient
+    from notion_mcp.server import run_sse
+    from notion_mcp.tools.handlers import todo_tools
+
+    # server.py configures DEBUG logging; per-message logs would dominate.
+    logging.getLogger().setLevel(logging.WARNING)
+
+    notion_requests = 0
+    page = _page(rows)
+
+    async def notion(request: httpx.Request) -> httpx.Response:
+        nonlocal notion_requests
+        notion_requests += 1
+        await asyncio.sleep(notion_latency)
+        return httpx.Response(200, json=page)
+
+    todo_tools.client = NotionClient(transport=httpx.MockTransport(notion))
+
+    port = _free_port()
+    server_task = asyncio.create_task(run_sse("127.0.0.1", port, log_level="warning"))
+    await _wait_for_port(port)
+
+    connected = asyncio.Event()
+    ready = 0
+    connect_latencies = []
+    call_latencies = []
+
+    async def session(index: int):
+        nonlocal ready
+        started = time.perf_counter()
+        async with sse_client(f"http://127.0.0.1:{port}/sse", timeout=60) as (read, write):
+            async with ClientSession(read, write) as client:
+                await client.initialize()
+                connect_latencies.append(time.perf_counter() - started)
+                ready += 1
+                if ready == sessions:
+                    connected.set()
+                await connected.wait()
+
+                day = index % distinct_queries + 1
+                started = time.perf_counter()
+                await client.call_tool("show_specific_date_todos", {
+                    "start_date": f"2024-05-{day:02d}T00:00:00",
+                    "end_date": f"2024-05-{day:02d}T23:59:59",
+                })
+                call_latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    # SSE streams still open on the server side are torn down by cancellation.
+    logging.disable(logging.CRITICAL)
+    server_task.cancel()
+    try:
+        await server_task
+    except asyncio.CancelledError:
+        pass
+
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"concurrent sessions held:   {ready}/{sessions} in one process")
+    print(f"total wall time:            {elapsed:.2f}s "
+          f"({sessions / elapsed:.1f} sessions/s)")
+    print(f"connect+initialize latency: p50={statistics.median(connect_latencies) * 1000:.1f}ms "
+          f"p95={_percentile(connect_latencies, 95) * 1000:.1f}ms")
+    print(f"tool call latency:          p50={statistics.median(call_latencies) * 1000:.1f}ms "
+          f"p95={_percentile(call_latencies, 95) * 1000:.1f}ms "
+          f"p99={_percentile(call_latencies, 99) * 1000:.1f}ms")
+    print(f"requests sent to Notion:    {notion_requests} "
+          f"for {sessions} tool calls ({distinct_queries} distinct queries)")
+    print(f"peak RSS (client+server):   {max_rss_mb:.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--notion-latency", type=float, default=0.05,
+                        help="Simulated Notion response time in seconds")
+    parser.add_argument("--distinct-queries", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="Notion requests per second (0 disables the limiter)")
+    args = parser.parse_args()
+
+    os.environ["NOTION_REQUESTS_PER_SECOND"] = str(args.rate)
+    asyncio.run(run(args.sessions, args.notion_latency,
+                    args.distinct_queries, args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,177 @@
+import asyncio
 import httpx
+import logging
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..config.settings import get_settings
 from ..models.todo import Todo, TodoCreate
-from ..utils.cache import RelationCache
+from ..utils.cache import RelationCache, QueryCache
+from ..utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from ..utils.hedging import HedgeBudget, LatencyTracker
+from ..utils.metrics import Metrics
+from ..utils.rate_limit import RateLimiter
+from ..utils.schedule_index import ScheduleIndex
 
-from .utils import to_utc_date_str, JST
+from .utils import to_utc_date_str, parse_notion_datetime
 from .parsers import (
     parse_title_property, parse_checkbox_property, parse_date_property,
-    parse_select_property, parse_relations_property
+    parse_date_end_property, parse_select_property, parse_relations_property
+)
+from .payloads import (
+    build_filter_condition, build_query_payload, build_schedule_query_payload,
+    build_properties_for_todo
 )
-from .payloads import build_filter_condition, build_query_payload, build_properties_for_todo
 
 settings = get_settings()
+logger = logging.getLogger('notion_mcp')
+
+
+def _is_degraded_error(error: Exception) -> bool:
+    """Whether an error indicates Notion itself is unhealthy."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
 
 
 class NotionClient:
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.headers = {
             "Authorization": f"Bearer {settings.notion_api_key}",
             "Content-Type": "application/json",
             "Notion-Version": settings.notion_version
         }
         self.cache = RelationCache()
+        self.query_cache = QueryCache(
+            ttl=settings.query_cache_ttl,
+            max_entries=settings.query_cache_max_entries,
+            stale_ttl=settings.query_cache_stale_ttl)
+        self.rate_limiter = RateLimiter(settings.notion_requests_per_second)
+        self.schedule = ScheduleIndex(ttl=settings.schedule_index_ttl)
+        self._schedule_lock = asyncio.Lock()
+        self.metrics = Metrics()
+        self.latency = LatencyTracker(
+            percentile=settings.hedge_percentile,
+            initial_delay=settings.hedge_initial_delay)
+        self.hedge_budget = HedgeBudget(settings.hedge_budget_ratio)
+        self.breaker = CircuitBreaker(
+            self.metrics,
+            failure_threshold=settings.circuit_failure_threshold,
+            reset_timeout=settings.circuit_reset_timeout)
+        self._transport = transport
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled HTTP client, creating it on first use.
+        The pool is shared by every session served by this process.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                base_url=settings.notion_base_url,
+                headers=self.headers,
+                transport=self._transport,
+                limits=httpx.Limits(
+                    max_connections=settings.notion_max_connections)
+            )
+        return self._http_client
+
+    async def _request(self, method: str, path: str, hedge: bool = False, **kwargs) -> dict:
+        """
+        Send a rate-limited request to Notion and return the JSON body.
+        Read-only requests may pass hedge=True to race a duplicate request
+        once the primary is slower than the adaptive latency threshold.
+        Raises CircuitOpenError without sending while Notion is degraded.
+        """
+        trial = self.breaker.before_request()
+        try:
+            if hedge:
+                response = await self._send_hedged(method, path, **kwargs)
+            else:
+                await self.rate_limiter.acquire()
+                response = await self._send(method, path, **kwargs)
+        except Exception as e:
+            if _is_degraded_error(e):
+                self.breaker.record_failure(trial)
+            else:
+                self.breaker.record_success(trial)
+            raise
+        except asyncio.CancelledError:
+            self.breaker.release(trial)
+            raise
+        self.breaker.record_success(trial)
+        return response.json()
+
+    async def _send(self, method: str, path: str, record_latency: bool = False, **kwargs) -> httpx.Response:
+        """
+        Send a request whose rate-limit token is already acquired.
+        With record_latency, successful responses and cancelled losing hedges
+        feed the hedging threshold, which should only see read latency.
+        Raises httpx.HTTPStatusError for error statuses.
+        """
+        started = time.monotonic()
+        try:
+            response = await self._get_http_client().request(method, path, **kwargs)
+        except asyncio.CancelledError:
+            if record_latency:
+                self.latency.record(time.monotonic() - started)
+            raise
+        if record_latency and response.is_success:
+            self.latency.record(time.monotonic() - started)
+        response.raise_for_status()
+        return response
+
+    async def _send_hedge(self, method: str, path: str, **kwargs) -> httpx.Response:
+        await self.rate_limiter.acquire()
+        return await self._send(method, path, record_latency=True, **kwargs)
+
+    async def _send_hedged(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Return the first successful response of the primary and, if sent, the hedge.
+        The hedge timer starts once the primary holds its rate-limit token, and
+        the hedge takes a token of its own.
+        """
+        await self.rate_limiter.acquire()
+        self.hedge_budget.deposit()
+        primary = asyncio.create_task(
+            self._send(method, path, record_latency=True, **kwargs))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.latency.threshold())
+            if done:
+                return primary.result()
+            if not self.hedge_budget.withdraw():
+                self.metrics.increment("hedges_over_budget")
+                return await primary
+
+            self.metrics.increment("hedged_requests")
+            hedge = asyncio.create_task(
+                self._send_hedge(method, path, **kwargs))
+            tasks.add(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.metrics.increment("hedge_wins")
+                        return task.result()
+            return primary.result()
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            await asyncio.gather(*losers, return_exceptions=True)
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def fetch_todos(
         self,
@@ -32,21 +180,19 @@ class NotionClient:
         done: Optional[bool] = None
     ) -> List[Todo]:
         """
-        Fetch todos from the Notion database with optional date filtering in JST.
+        Fetch todos from the Notion database with optional date filtering in the configured TZ.
         Returns a list of Todo objects.
         """
         filter_condition = build_filter_condition(
             start_date, end_date, to_utc_date_str, done)
         query_payload = build_query_payload(filter_condition)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.notion_base_url}/databases/{settings.notion_todo_database_id}/query",
-                headers=self.headers,
-                json=query_payload
-            )
-            response.raise_for_status()
-            data = response.json()
+        cache_key = QueryCache.make_key(
+            settings.notion_todo_database_id, query_payload)
+        generation = self.query_cache.generation
+        data = self.query_cache.get(cache_key)
+        if data is None:
+            data = await self._query_todo_database(cache_key, query_payload)
 
         todos = []
         for item in data.get("results", []):
@@ -54,8 +200,93 @@ class NotionClient:
             if todo:
                 todos.append(todo)
 
+        # Results of a query that raced a mutation may predate it and would
+        # undo the mutation in the index.
+        if self.schedule.loaded and generation == self.query_cache.generation:
+            self.schedule.update(todos)
         return todos
 
+    async def _query_todo_database(self, cache_key: str, query_payload: dict) -> dict:
+        """
+        Query the todo database, sharing one in-flight request between
+        concurrent callers (e.g. several sessions) asking the same query.
+        """
+        flight_key = (self.query_cache.generation, cache_key)
+        flight = self._inflight.get(flight_key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._query_todo_database_uncoalesced(cache_key, query_payload))
+            self._inflight[flight_key] = flight
+            flight.add_done_callback(
+                lambda _: self._inflight.pop(flight_key, None))
+        else:
+            self.metrics.increment("coalesced_queries")
+        return await asyncio.shield(flight)
+
+    async def _query_todo_database_uncoalesced(self, cache_key: str, query_payload: dict) -> dict:
+        generation = self.query_cache.generation
+        try:
+            data = await self._request(
+                "POST",
+                f"/databases/{settings.notion_todo_database_id}/query",
+                hedge=True,
+                json=query_payload
+            )
+        except CircuitOpenError:
+            data = self.query_cache.get(cache_key, allow_stale=True)
+            if data is None:
+                raise
+            self.metrics.increment("stale_cache_fallbacks")
+            logger.warning("Notion is degraded, serving cached todos")
+        else:
+            self.query_cache.set(cache_key, data, generation=generation)
+        return data
+
+    async def fetch_open_scheduled_todos(self) -> List[Todo]:
+        """Fetch every open todo that has a Date, following Notion's pagination."""
+        query_payload = build_schedule_query_payload()
+        todos = []
+        while True:
+            data = await self._request(
+                "POST",
+                f"/databases/{settings.notion_todo_database_id}/query",
+                hedge=True,
+                json=query_payload
+            )
+            for item in data.get("results", []):
+                todo = self._build_todo_from_properties(item)
+                if todo:
+                    todos.append(todo)
+            next_cursor = data.get("next_cursor")
+            if not data.get("has_more") or not next_cursor:
+                return todos
+            query_payload = build_schedule_query_payload(next_cursor)
+
+    async def ensure_schedule_index(self) -> ScheduleIndex:
+        """
+        Return the schedule index, rebuilding it from every open scheduled
+        todo on first use and once it is older than its TTL. In between it is
+        kept current by fetches and mutations made through this client.
+        While the circuit is open, an already loaded index is used as is.
+        """
+        async with self._schedule_lock:
+            if self.schedule.is_stale():
+                generation = self.query_cache.generation
+                try:
+                    todos = await self.fetch_open_scheduled_todos()
+                except CircuitOpenError:
+                    if not self.schedule.loaded:
+                        raise
+                    self.metrics.increment("stale_cache_fallbacks")
+                    logger.warning(
+                        "Notion is degraded, using the existing schedule index")
+                    return self.schedule
+                self.schedule.build(todos)
+                if generation != self.query_cache.generation:
+                    # A mutation landed mid-rebuild and may be missing from it.
+                    self.schedule.expire()
+        return self.schedule
+
     async def create_todo(self, todo_data: TodoCreate) -> Todo:
         """
         Create a new todo in Notion using a TodoCreate object.
@@ -63,19 +294,17 @@ class NotionClient:
         """
         properties = build_properties_for_todo(todo_data, creating=True)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.notion_base_url}/pages",
-                headers=self.headers,
-                json={
-                    "parent": {"database_id": settings.notion_todo_database_id},
-                    "properties": properties
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+        data = await self._request(
+            "POST",
+            "/pages",
+            json={
+                "parent": {"database_id": settings.notion_todo_database_id},
+                "properties": properties
+            }
+        )
+        self.query_cache.invalidate()
 
-        return self._build_todo_from_properties(data)
+        return self._index_todo(self._build_todo_from_properties(data))
 
     async def change_todo_schedule(
         self,
@@ -97,38 +326,40 @@ class NotionClient:
             }
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{settings.notion_base_url}/pages/{page_id}",
-                headers=self.headers,
-                json={
-                    "properties": date_property
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+        data = await self._request(
+            "PATCH",
+            f"/pages/{page_id}",
+            json={
+                "properties": date_property
+            }
+        )
+        self.query_cache.invalidate()
 
-        return self._build_todo_from_properties(data)
+        return self._index_todo(self._build_todo_from_properties(data))
 
     async def complete_todo(self, page_id: str) -> Todo:
         """Mark a todo as complete in Notion and return the updated Todo."""
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{settings.notion_base_url}/pages/{page_id}",
-                headers=self.headers,
-                json={
-                    "properties": {
-                        "Done": {
-                            "type": "checkbox",
-                            "checkbox": True
-                        }
+        data = await self._request(
+            "PATCH",
+            f"/pages/{page_id}",
+            json={
+                "properties": {
+                    "Done": {
+                        "type": "checkbox",
+                        "checkbox": True
                     }
                 }
-            )
-            response.raise_for_status()
-            data = response.json()
+            }
+        )
+        self.query_cache.invalidate()
+
+        return self._index_todo(self._build_todo_from_properties(data))
 
-        return self._build_todo_from_properties(data)
+    def _index_todo(self, todo: Optional[Todo]) -> Optional[Todo]:
+        """Reflect a mutated todo in the schedule index and return it."""
+        if todo and self.schedule.loaded:
+            self.schedule.update([todo])
+        return todo
 
     def _build_todo_from_properties(self, notion_data: dict) -> Optional[Todo]:
         """
@@ -141,19 +372,15 @@ class NotionClient:
         done = parse_checkbox_property(
             props, "Checkbox") or parse_checkbox_property(props, "Done")
         date_value = parse_date_property(props, "Date")
+        date_end = parse_date_end_property(props, "Date")
         priority = parse_select_property(props, "Priority")
         projects = parse_relations_property(
             self.cache, props, "Project", settings.notion_project_database_id)
         repeat_task = parse_select_property(props, "Repeat")
 
         created_time_str = notion_data.get("created_time")
-        created_time = None
-        if created_time_str:
-            try:
-                created_time = datetime.fromisoformat(
-                    created_time_str.replace("Z", "+00:00")).astimezone(JST)
-            except ValueError:
-                pass
+        created_time = parse_notion_datetime(
+            created_time_str) if created_time_str else None
 
         _id = notion_data.get("id")
         if not _id or not name:
@@ -163,6 +390,7 @@ class NotionClient:
             id=_id,
             name=name,
             date=date_value,
+            date_end=date_end,
             priority=priority,
             projects=projects,
             repeat_task=repeat_task,
@@ -173,14 +401,12 @@ class NotionClient:
     async def fetch_all_projects(self):
         projects_db_id = settings.notion_project_database_id
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.notion_base_url}/databases/{projects_db_id}/query",
-                headers=self.headers,
-                params={}
-            )
-            response.raise_for_status()
-            data = response.json()
+        data = await self._request(
+            "POST",
+            f"/databases/{projects_db_id}/query",
+            hedge=True,
+            params={}
+        )
 
         project_map = {}
         for item in data.get("results", []):
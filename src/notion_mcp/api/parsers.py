@@ -1,21 +1,34 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
-from .utils import JST
+from .utils import parse_notion_date
 from ..utils.cache import RelationCache
 
 
 def parse_date_property(props: dict, prop_name: str) -> Optional[datetime]:
-    """Parse a date property and return a datetime object in JST if available."""
-    date_data = props.get(prop_name, {}).get("date", {})
+    """Parse a date property and return a datetime object in the configured TZ if available."""
+    date_data = props.get(prop_name, {}).get("date") or {}
     start_str = date_data.get("start")
     if start_str:
-        try:
-            return datetime.fromisoformat(start_str.replace("Z", "+00:00")).astimezone(JST)
-        except ValueError:
-            pass
+        return parse_notion_date(start_str)
     return None
 
 
+def parse_date_end_property(props: dict, prop_name: str) -> Optional[datetime]:
+    """
+    Parse the end of a date range property and return it in the configured TZ if available.
+    Notion's date-only range ends are inclusive, so they are returned as
+    midnight after the last day.
+    """
+    date_data = props.get(prop_name, {}).get("date") or {}
+    end_str = date_data.get("end")
+    if not end_str:
+        return None
+    end = parse_notion_date(end_str)
+    if end and "T" not in end_str:
+        end += timedelta(days=1)
+    return end
+
+
 def parse_select_property(props: dict, prop_name: str) -> Optional[str]:
     """Parse a select property and return the selected name."""
     select_data = props.get(prop_name, {}).get("select")
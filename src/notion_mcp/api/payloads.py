@@ -38,6 +38,22 @@ def build_query_payload(filter_condition: dict) -> dict:
     return query_payload
 
 
+def build_schedule_query_payload(start_cursor: str = None) -> dict:
+    """Build the payload querying every open todo that has a Date."""
+    query_payload = {
+        "filter": {
+            "and": [
+                {"property": "Done", "checkbox": {"equals": False}},
+                {"property": "Date", "date": {"is_not_empty": True}}
+            ]
+        },
+        "page_size": 100
+    }
+    if start_cursor:
+        query_payload["start_cursor"] = start_cursor
+    return query_payload
+
+
 def build_properties_for_todo(todo_data: TodoCreate, creating: bool = False) -> dict:
     """
     Build the properties payload for Notion based on a TodoCreate object.
@@ -1,11 +1,50 @@
-import pytz
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo
+
 from ..config.settings import get_settings
 
 settings = get_settings()
-JST = pytz.timezone(settings.tz)
+
+# Resolved once at import; zoneinfo applies the correct offset for each
+# instant (DST included), unlike pytz with replace(tzinfo=...).
+LOCAL_TZ = ZoneInfo(settings.tz)
 
 
 def to_utc_date_str(dt: datetime) -> str:
     """Convert a datetime to its UTC ISO8601 string representation."""
     return dt.astimezone(timezone.utc).isoformat()
+
+
+def localize(dt: datetime) -> datetime:
+    """Interpret a naive datetime as local time, or convert an aware one to it."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=LOCAL_TZ)
+    return dt.astimezone(LOCAL_TZ)
+
+
+def parse_local_datetime(value: str) -> datetime:
+    """Parse an ISO8601 string from a tool argument into a local-time datetime."""
+    return localize(datetime.fromisoformat(value))
+
+
+def parse_notion_datetime(value: str) -> Optional[datetime]:
+    """
+    Parse a Notion timestamp or date string into a local-time datetime.
+    Returns None if the string is not valid ISO8601.
+    """
+    try:
+        return localize(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def parse_notion_date(value: str) -> Optional[datetime]:
+    """
+    Cached parse_notion_datetime for Date property values, which repeat
+    across rows. Values unique per row, like created_time, should call
+    parse_notion_datetime directly rather than churn this cache.
+    """
+    return parse_notion_datetime(value)
@@ -12,6 +12,20 @@ class Settings(BaseSettings):
     tz: str = Field(..., env="TZ")
     notion_version: str = "2022-06-28"
     notion_base_url: str = "https://api.notion.com/v1"
+    notion_requests_per_second: float = 3.0
+    notion_max_connections: int = 10
+    query_cache_ttl: float = 30.0
+    query_cache_max_entries: int = 256
+    query_cache_stale_ttl: float = 600.0
+    schedule_index_ttl: float = 300.0
+    hedge_percentile: float = 95.0
+    hedge_initial_delay: float = 1.0
+    hedge_budget_ratio: float = 0.1
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+    mcp_transport: str = "stdio"
+    mcp_host: str = "127.0.0.1"
+    mcp_port: int = 8000
 
     class Config:
         env_file = str(Path(__file__).parent.parent.parent.parent / ".env")
@@ -9,6 +9,7 @@ class Todo(BaseModel):
     id: str
     name: str
     date: Optional[datetime] = None
+    date_end: Optional[datetime] = None
     priority: Optional[str] = None
     projects: Optional[Relation] = None
     repeat_task: Optional[str] = None
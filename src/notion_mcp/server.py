@@ -3,8 +3,9 @@ from mcp.types import Tool, TextContent, EmbeddedResource
 import logging
 from typing import Any, Sequence
 
-from .tools.handlers import TOOL_HANDLERS
+from .tools.handlers import TOOL_HANDLERS, todo_tools
 from .api.notion import NotionClient
+from .config.settings import get_settings
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger('notion_mcp')
 
@@ -41,8 +42,8 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | Embedde
         ]
 
 
-async def main():
-    """Main entry point for the server"""
+async def run_stdio():
+    """Serve a single client over stdio."""
     from mcp.server.stdio import stdio_server
 
     async with stdio_server() as (read_stream, write_stream):
@@ -53,6 +54,59 @@ async def main():
         )
 
 
+async def run_sse(host: str, port: int, log_level: str = "info"):
+    """
+    Serve many concurrent clients over SSE from one long-running process.
+    Each connection gets its own MCP session, while the Notion client
+    (connection pool, rate budget, relation and query caches) is shared.
+    """
+    import uvicorn
+    from mcp.server.sse import SseServerTransport
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse, Response
+    from starlette.routing import Mount, Route
+
+    sse = SseServerTransport("/messages/")
+
+    async def handle_sse(request):
+        async with sse.connect_sse(
+            request.scope, request.receive, request._send
+        ) as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+        return Response()
+
+    async def handle_metrics(request):
+        return JSONResponse(todo_tools.client.metrics.snapshot())
+
+    app = Starlette(routes=[
+        Route("/sse", endpoint=handle_sse),
+        Route("/metrics", endpoint=handle_metrics),
+        Mount("/messages/", app=sse.handle_post_message),
+    ])
+
+    config = uvicorn.Config(app, host=host, port=port, log_level=log_level)
+    await uvicorn.Server(config).serve()
+
+
+async def main():
+    """Main entry point for the server"""
+    settings = get_settings()
+    try:
+        if settings.mcp_transport == "sse":
+            await run_sse(settings.mcp_host, settings.mcp_port)
+        elif settings.mcp_transport == "stdio":
+            await run_stdio()
+        else:
+            raise ValueError(
+                f"Unknown transport: {settings.mcp_transport}")
+    finally:
+        await todo_tools.client.aclose()
+
+
 if __name__ == "__main__":
     import asyncio
     asyncio.run(main())
@@ -1,13 +1,14 @@
 from mcp.types import TextContent
 from typing import Sequence
-from datetime import datetime
-import pytz
+from datetime import datetime, timedelta
 
 from .todo_tools import TodoTools
-from ..config.settings import get_settings
+from ..api.utils import LOCAL_TZ, parse_local_datetime
 
 todo_tools = TodoTools()
 
+MIN_SCHEDULE_DURATION = timedelta(minutes=30)
+
 
 async def handle_add_todo(arguments: dict) -> Sequence[TextContent]:
     task = arguments.get("task")
@@ -22,25 +23,17 @@ async def handle_add_todo(arguments: dict) -> Sequence[TextContent]:
 
 
 async def handle_show_specific_date_todos(arguments: dict) -> Sequence[TextContent]:
-    settings = get_settings()
-    tz = pytz.timezone(settings.tz)
-
     start_str = arguments.get("start_date")
     end_str = arguments.get("end_date")
     done = arguments.get("done", None)
 
-    start_date = datetime.fromisoformat(start_str).replace(
-        tzinfo=tz) if start_str else None
-    end_date = datetime.fromisoformat(end_str).replace(
-        tzinfo=tz) if end_str else None
+    start_date = parse_local_datetime(start_str) if start_str else None
+    end_date = parse_local_datetime(end_str) if end_str else None
 
     return [await todo_tools.show_todos(start_date=start_date, end_date=end_date, done=done)]
 
 
 async def handle_change_todo_schedule(arguments: dict) -> Sequence[TextContent]:
-    settings = get_settings()
-    tz = pytz.timezone(settings.tz)
-
     task_id = arguments.get("task_id")
     start_datetime = arguments.get("start_datetime")
     end_datetime = arguments.get("end_datetime")
@@ -50,12 +43,49 @@ async def handle_change_todo_schedule(arguments: dict) -> Sequence[TextContent]:
     if not start_datetime or not end_datetime:
         raise ValueError("start_datetime and end_datetime are required")
 
-    start_datetime = datetime.fromisoformat(start_datetime).replace(tzinfo=tz)
-    end_datetime = datetime.fromisoformat(end_datetime).replace(tzinfo=tz)
+    start_datetime = parse_local_datetime(start_datetime)
+    end_datetime = parse_local_datetime(end_datetime)
+
+    # Compare instants, not wall-clock times, so DST shifts are accounted for.
+    elapsed = end_datetime.timestamp() - start_datetime.timestamp()
+    if elapsed < MIN_SCHEDULE_DURATION.total_seconds():
+        raise ValueError(
+            "end_datetime must be at least 30 minutes after start_datetime")
 
     return [await todo_tools.change_todo_schedule(task_id, start_datetime, end_datetime)]
 
 
+def _parse_minutes(value) -> int:
+    """Accept an integer, an integral float or a string of digits; reject the rest."""
+    if isinstance(value, bool):
+        raise ValueError("duration_minutes must be an integer")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError("duration_minutes must be an integer")
+        return int(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise ValueError("duration_minutes must be an integer")
+
+
+async def handle_find_free_slot(arguments: dict) -> Sequence[TextContent]:
+    after_str = arguments.get("after")
+
+    duration_minutes = _parse_minutes(arguments.get("duration_minutes"))
+    if duration_minutes <= 0:
+        raise ValueError("duration_minutes must be a positive number")
+
+    after = parse_local_datetime(
+        after_str) if after_str else datetime.now(LOCAL_TZ)
+
+    return [await todo_tools.find_free_slot(after, timedelta(minutes=duration_minutes))]
+
+
 async def handle_complete_todo(arguments: dict) -> Sequence[TextContent]:
     task_id = arguments.get("task_id")
     if not task_id:
@@ -124,6 +154,24 @@ TOOL_HANDLERS = {
             "required": ["task_id", "start_datetime", "end_datetime"]
         }
     },
+    "find_free_slot": {
+        "handler": handle_find_free_slot,
+        "description": "Find the next free time window of the given length among scheduled open todos",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "duration_minutes": {
+                    "type": "integer",
+                    "description": "Length of the window in minutes"
+                },
+                "after": {
+                    "type": "string",
+                    "description": "Earliest start of the window (YYYY-MM-DDTHH:MM:SS.SSSSSS). If omitted, the current time is used."
+                }
+            },
+            "required": ["duration_minutes"]
+        }
+    },
     "complete_todo": {
         "handler": handle_complete_todo,
         "description": "Mark a todo item as complete",
@@ -1,10 +1,11 @@
 from mcp.types import TextContent
 from typing import List, Optional
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from ..api.notion import NotionClient
-from ..models.todo import TodoCreate
+from ..api.utils import LOCAL_TZ
+from ..models.todo import Todo, TodoCreate
 
 
 class TodoTools:
@@ -12,7 +13,7 @@ class TodoTools:
         self.client = NotionClient()
 
     async def add_todo(self, task: str, when: str) -> TextContent:
-        date_value = datetime.now() if when.lower() == "today" else None
+        date_value = datetime.now(LOCAL_TZ) if when.lower() == "today" else None
 
         todo_create = TodoCreate(
             name=task,
@@ -28,9 +29,19 @@ class TodoTools:
         return self._format_show_message(todos)
 
     async def change_todo_schedule(self, task_id: str, start_datetime: datetime, end_datetime: Optional[datetime]) -> TextContent:
+        conflicts = []
+        if end_datetime:
+            schedule = await self.client.ensure_schedule_index()
+            conflicts = schedule.conflicts(
+                start_datetime, end_datetime, exclude_id=task_id)
         todo = await self.client.change_todo_schedule(
             task_id, start_datetime, end_datetime)
-        return self._format_change_message(todo.name, start_datetime, end_datetime)
+        return self._format_change_message(todo.name, start_datetime, end_datetime, conflicts)
+
+    async def find_free_slot(self, after: datetime, duration: timedelta) -> TextContent:
+        schedule = await self.client.ensure_schedule_index()
+        start, end = schedule.find_free_slot(after, duration)
+        return self._format_free_slot_message(start, end)
 
     async def complete_todo(self, task_id: str) -> TextContent:
         todo = await self.client.complete_todo(task_id)
@@ -50,11 +61,20 @@ class TodoTools:
                             for todo in todos], indent=2, default=str)
         )
 
-    def _format_change_message(self, task_name: str, start_datetime: Optional[datetime], end_datetime: Optional[datetime]) -> TextContent:
+    def _format_change_message(self, task_name: str, start_datetime: Optional[datetime], end_datetime: Optional[datetime], conflicts: List[Todo]) -> TextContent:
+        text = f"Changed todo schedule: {task_name} from {start_datetime} to {end_datetime}"
+        if conflicts:
+            text += "\nConflicts with: " + ", ".join(
+                f"{todo.name} ({todo.id}, {todo.date} to {todo.date_end})" for todo in conflicts)
+        return TextContent(
+            type="text",
+            text=text
+        )
+
+    def _format_free_slot_message(self, start: datetime, end: datetime) -> TextContent:
         return TextContent(
             type="text",
-            text=f"Changed todo schedule: {task_name} from {
-                start_datetime} to {end_datetime}"
+            text=f"Next free slot: {start.isoformat()} to {end.isoformat()}"
         )
 
     def _format_complete_message(self, task_name: str) -> TextContent:
@@ -1,7 +1,9 @@
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 import logging
 import json
 import os
+import time
 
 logger = logging.getLogger('notion_mcp')
 
@@ -49,3 +51,62 @@ class RelationCache:
 
     def exists(self, database_id: str, relation_id: str) -> bool:
         return (f"{database_id}:{relation_id}" in self._cache)
+
+
+class QueryCache:
+    """
+    In-memory TTL cache for Notion query results, shared across sessions.
+    Holds at most `max_entries` results, evicting the least recently used.
+    Expired entries are kept for up to `stale_ttl` more seconds so they can
+    serve as a fallback with allow_stale=True.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 256, stale_ttl: float = 600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self.generation = 0
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return json.dumps(parts, sort_keys=True, default=str)
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        now = self._clock()
+        if now >= expires_at + self.stale_ttl:
+            del self._entries[key]
+            return None
+        if not allow_stale and now >= expires_at:
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, generation: Optional[int] = None):
+        """
+        Store a value. If `generation` is given and the cache has been
+        invalidated since, the value is dropped as it may predate a mutation.
+        """
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self):
+        self._entries.clear()
+        self.generation += 1
+        logger.debug("Query cache invalidated")
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,95 @@
+import logging
+import time
+from typing import Callable
+
+from .metrics import Metrics
+
+logger = logging.getLogger('notion_mcp')
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is refused because Notion is considered degraded."""
+
+
+class CircuitBreaker:
+    """
+    Fails fast after `failure_threshold` consecutive failures.
+    After `reset_timeout` seconds a single trial request is let through;
+    its outcome closes the circuit again or reopens it.
+    """
+
+    def __init__(self, metrics: Metrics, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.metrics = metrics
+        self._clock = clock
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.metrics.set_gauge("circuit_state", self.state)
+
+    def _transition(self, state: str):
+        if state == self.state:
+            return
+        logger.warning(f"Notion circuit breaker: {self.state} -> {state}")
+        self.metrics.increment(f"circuit_{self.state}_to_{state}")
+        self.state = state
+        self.metrics.set_gauge("circuit_state", state)
+
+    def before_request(self) -> bool:
+        """
+        Raise CircuitOpenError if the request must not be sent.
+        Returns True if the request is the half-open trial; pass that on to
+        record_success, record_failure or release.
+        """
+        if self.state == OPEN:
+            if self._clock() - self._opened_at < self.reset_timeout:
+                self.metrics.increment("circuit_rejected")
+                raise CircuitOpenError("Notion API circuit is open")
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self._trial_in_flight:
+                self.metrics.increment("circuit_rejected")
+                raise CircuitOpenError("Notion API circuit is half-open")
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release(self, trial: bool = False):
+        """Forget an in-flight trial whose outcome is unknown, e.g. on cancellation."""
+        if trial:
+            self._trial_in_flight = False
+
+    def record_success(self, trial: bool = False):
+        """
+        Record a success. Only the half-open trial can close the circuit;
+        late successes of requests admitted before it opened are ignored.
+        """
+        if trial and self.state == HALF_OPEN:
+            self._trial_in_flight = False
+            self._failures = 0
+            self._transition(CLOSED)
+        elif self.state == CLOSED:
+            self._failures = 0
+
+    def record_failure(self, trial: bool = False):
+        """
+        Record a failure. Opens the circuit after `failure_threshold`
+        consecutive failures while closed, or when the half-open trial fails.
+        """
+        if trial and self.state == HALF_OPEN:
+            self._trial_in_flight = False
+        elif self.state == CLOSED:
+            self._failures += 1
+            if self._failures < self.failure_threshold:
+                return
+        else:
+            return
+        self._opened_at = self._clock()
+        self._transition(OPEN)
@@ -0,0 +1,51 @@
+from collections import deque
+
+
+class LatencyTracker:
+    """
+    Tracks recent response latencies and derives the hedging delay
+    from a percentile of them.
+    """
+
+    def __init__(self, percentile: float = 95.0, initial_delay: float = 1.0,
+                 min_delay: float = 0.05, window: int = 200, min_samples: int = 20):
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def threshold(self) -> float:
+        """Seconds to wait for a response before sending a hedge."""
+        if len(self._samples) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1,
+                    int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+
+class HedgeBudget:
+    """
+    Caps hedges at `ratio` of hedgeable requests. Each request earns `ratio`
+    credit (up to `max_credit`) and each hedge spends one. Starts with one
+    hedge of credit so a cold process can still cut its first slow request.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_credit: float = 10.0):
+        self.ratio = ratio
+        self.max_credit = max_credit
+        self._credit = 1.0
+
+    def deposit(self):
+        self._credit = min(self.max_credit, self._credit + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one hedge if the budget allows it."""
+        if self._credit < 1:
+            return False
+        self._credit -= 1
+        return True
@@ -0,0 +1,18 @@
+from typing import Any, Dict
+
+
+class Metrics:
+    """Process-wide counters and gauges for the Notion client."""
+
+    def __init__(self):
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, Any] = {}
+
+    def increment(self, name: str, value: int = 1):
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: Any):
+        self._gauges[name] = value
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {"counters": dict(self._counters), "gauges": dict(self._gauges)}
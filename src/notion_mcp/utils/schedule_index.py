@@ -0,0 +1,180 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+import time
+
+from ..models.todo import Todo
+
+logger = logging.getLogger('notion_mcp')
+
+_NEG_INF = float("-inf")
+
+
+class _MaxSegmentTree:
+    """Segment tree over a fixed list of floats answering max-based searches."""
+
+    def __init__(self, values: List[float]):
+        self._n = len(values)
+        self._size = 1
+        while self._size < max(self._n, 1):
+            self._size *= 2
+        self._tree = [_NEG_INF] * (2 * self._size)
+        self._tree[self._size:self._size + self._n] = values
+        for i in range(self._size - 1, 0, -1):
+            self._tree[i] = max(self._tree[2 * i], self._tree[2 * i + 1])
+
+    def first_at_least(self, lo: int, threshold: float) -> Optional[int]:
+        """Return the smallest index >= lo whose value is >= threshold."""
+        if lo >= self._n:
+            return None
+        return self._first_at_least(1, 0, self._size, lo, threshold)
+
+    def _first_at_least(self, node: int, left: int, right: int, lo: int, threshold: float) -> Optional[int]:
+        if right <= lo or self._tree[node] < threshold:
+            return None
+        if right - left == 1:
+            return left
+        mid = (left + right) // 2
+        found = self._first_at_least(2 * node, left, mid, lo, threshold)
+        if found is None:
+            found = self._first_at_least(2 * node + 1, mid, right, lo, threshold)
+        return found
+
+    def indices_above(self, hi: int, threshold: float) -> List[int]:
+        """Return every index < hi whose value is > threshold."""
+        result: List[int] = []
+        if hi > 0:
+            self._indices_above(1, 0, self._size, hi, threshold, result)
+        return result
+
+    def _indices_above(self, node: int, left: int, right: int, hi: int, threshold: float, result: List[int]):
+        if left >= hi or self._tree[node] <= threshold:
+            return
+        if right - left == 1:
+            result.append(left)
+            return
+        mid = (left + right) // 2
+        self._indices_above(2 * node, left, mid, hi, threshold, result)
+        self._indices_above(2 * node + 1, mid, right, hi, threshold, result)
+
+
+class ScheduleIndex:
+    """
+    Interval index over the Date start/end of open todos.
+
+    Intervals are kept sorted by start with a max-end segment tree, so an
+    overlap query reporting k todos costs O(k log n). The union of busy time
+    is kept as disjoint blocks with a max-gap segment tree, so the next free
+    window of a given length is found in O(log n). Both structures are
+    rebuilt from scratch in O(n log n) whenever an interval is added, moved
+    or dropped; updates that change no interval skip the rebuild.
+    Todos without an end, or already done, do not occupy any time.
+
+    The contents go stale `ttl` seconds after the last full build, since
+    todos deleted or archived in Notion are never seen by later updates.
+    """
+
+    def __init__(self, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.loaded = False
+        self.ttl = ttl
+        self._clock = clock
+        self._built_at = float("-inf")
+        self._todos: Dict[str, Todo] = {}
+        self._rebuild()
+
+    def is_stale(self) -> bool:
+        """Whether a full rebuild is due."""
+        return not self.loaded or self._clock() - self._built_at >= self.ttl
+
+    def expire(self):
+        """Force a full rebuild on next use."""
+        self._built_at = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self._todos)
+
+    @staticmethod
+    def _interval(todo: Todo) -> Optional[Tuple[float, float]]:
+        if todo.done or not todo.date or not todo.date_end:
+            return None
+        start, end = todo.date.timestamp(), todo.date_end.timestamp()
+        if end <= start:
+            return None
+        return start, end
+
+    def build(self, todos: Iterable[Todo]):
+        """Replace the index contents with the given todos."""
+        self._todos = {
+            todo.id: todo for todo in todos if self._interval(todo)}
+        self.loaded = True
+        self._built_at = self._clock()
+        self._rebuild()
+        logger.debug(f"Schedule index built with {len(self._todos)} todos")
+
+    def update(self, todos: Iterable[Todo]):
+        """Insert, move or drop the given todos according to their current state."""
+        changed = False
+        for todo in todos:
+            interval = self._interval(todo)
+            previous = self._todos.get(todo.id)
+            if interval:
+                if previous is None or self._interval(previous) != interval:
+                    changed = True
+                self._todos[todo.id] = todo
+            elif previous is not None:
+                del self._todos[todo.id]
+                changed = True
+        if changed:
+            self._rebuild()
+
+    def remove(self, todo_id: str):
+        if self._todos.pop(todo_id, None) is not None:
+            self._rebuild()
+
+    def _rebuild(self):
+        entries = sorted(
+            (self._interval(todo) + (todo_id,) for todo_id, todo in self._todos.items()))
+        self._ids = [todo_id for _, _, todo_id in entries]
+        self._starts = [start for start, _, _ in entries]
+        self._ends_tree = _MaxSegmentTree([end for _, end, _ in entries])
+
+        block_starts: List[float] = []
+        block_ends: List[float] = []
+        for start, end, _ in entries:
+            if block_ends and start <= block_ends[-1]:
+                block_ends[-1] = max(block_ends[-1], end)
+            else:
+                block_starts.append(start)
+                block_ends.append(end)
+        self._block_starts = block_starts
+        self._block_ends = block_ends
+        self._gaps_tree = _MaxSegmentTree([
+            block_starts[i + 1] - block_ends[i] for i in range(len(block_starts) - 1)])
+
+    def conflicts(self, start: datetime, end: datetime, exclude_id: Optional[str] = None) -> List[Todo]:
+        """Return the open todos whose interval overlaps [start, end)."""
+        hi = bisect_left(self._starts, end.timestamp())
+        indices = self._ends_tree.indices_above(hi, start.timestamp())
+        return [self._todos[self._ids[i]] for i in indices if self._ids[i] != exclude_id]
+
+    def find_free_slot(self, after: datetime, duration: timedelta) -> Tuple[datetime, datetime]:
+        """Return the earliest window of the given length starting at or after `after`."""
+        tz = after.tzinfo or timezone.utc
+        length = duration.total_seconds()
+        candidate = after.timestamp()
+
+        j = bisect_right(self._block_ends, candidate)
+        if j < len(self._block_starts):
+            if self._block_starts[j] > candidate:
+                # Free time before block j; use it if long enough.
+                if self._block_starts[j] - candidate >= length:
+                    return self._slot(candidate, length, tz)
+            gap = self._gaps_tree.first_at_least(j, length)
+            candidate = self._block_ends[-1] if gap is None else self._block_ends[gap]
+        return self._slot(candidate, length, tz)
+
+    @staticmethod
+    def _slot(start: float, length: float, tz) -> Tuple[datetime, datetime]:
+        return (datetime.fromtimestamp(start, tz),
+                datetime.fromtimestamp(start + length, tz))
@@ -0,0 +1,40 @@
+import os
+
+# Settings are read at import time, so the required values must exist
+# before any notion_mcp module is imported.
+os.environ.setdefault("NOTION_API_KEY", "test-key")
+os.environ.setdefault("NOTION_TODO_DATABASE_ID", "todo-db")
+os.environ.setdefault("NOTION_PROJECT_DATABASE_ID", "project-db")
+os.environ.setdefault("TZ", "Asia/Tokyo")
+
+import pytest
+
+
+def notion_page(rows: list, has_more: bool = False, next_cursor: str = None) -> dict:
+    return {"results": rows, "has_more": has_more, "next_cursor": next_cursor}
+
+
+def notion_todo(todo_id: str, start: str = None, end: str = None, done: bool = False,
+                created_time: str = "2024-05-01T00:00:00.000Z") -> dict:
+    properties = {
+        "Task": {"title": [{"text": {"content": f"Task {todo_id}"}}]},
+        "Done": {"checkbox": done},
+    }
+    if start:
+        properties["Date"] = {"date": {"start": start, "end": end}}
+    return {"id": todo_id, "created_time": created_time, "properties": properties}
+
+
+@pytest.fixture
+def make_client():
+    """Build a NotionClient backed by an httpx.MockTransport handler."""
+    import httpx
+    from notion_mcp.api.notion import NotionClient
+    from notion_mcp.utils.rate_limit import RateLimiter
+
+    def factory(handler):
+        client = NotionClient(transport=httpx.MockTransport(handler))
+        client.rate_limiter = RateLimiter(0)
+        return client
+
+    return factory
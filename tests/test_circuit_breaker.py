@@ -0,0 +1,128 @@
+import pytest
+
+from notion_mcp.utils.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+)
+from notion_mcp.utils.metrics import Metrics
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(Metrics(), failure_threshold=2, reset_timeout=30, clock=clock)
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures_only(breaker):
+    breaker.before_request()
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_success()
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_open_circuit_fails_fast_until_reset_timeout(breaker, clock):
+    trip(breaker)
+    clock.now = 29
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock.now = 30
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+
+
+def test_half_open_lets_a_single_trial_through(breaker, clock):
+    trip(breaker)
+    clock.now = 30
+    trial = breaker.before_request()
+    assert trial
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success(trial)
+    assert breaker.state == CLOSED
+    breaker.before_request()
+
+
+def test_failed_trial_reopens_for_a_full_timeout(breaker, clock):
+    trip(breaker)
+    clock.now = 30
+    trial = breaker.before_request()
+    breaker.record_failure(trial)
+    assert breaker.state == OPEN
+
+    clock.now = 59
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_release_frees_the_trial_slot(breaker, clock):
+    trip(breaker)
+    clock.now = 30
+    trial = breaker.before_request()
+    breaker.release(trial)
+
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+
+
+def test_transitions_are_recorded_in_metrics(breaker, clock):
+    trip(breaker)
+    clock.now = 30
+    trial = breaker.before_request()
+    breaker.record_success(trial)
+
+    snapshot = breaker.metrics.snapshot()
+    assert snapshot["gauges"]["circuit_state"] == CLOSED
+    assert snapshot["counters"]["circuit_closed_to_open"] == 1
+    assert snapshot["counters"]["circuit_open_to_half_open"] == 1
+    assert snapshot["counters"]["circuit_half_open_to_closed"] == 1
+
+
+def test_late_results_of_requests_admitted_before_opening_are_ignored(breaker, clock):
+    slow = breaker.before_request()
+    trip(breaker)
+
+    breaker.record_success(slow)
+    assert breaker.state == OPEN
+    breaker.record_failure(slow)
+    clock.now = 30
+    trial = breaker.before_request()
+    assert trial and breaker.state == HALF_OPEN
+
+    # A straggler finishing during the trial neither closes nor reopens it.
+    breaker.record_success(slow)
+    assert breaker.state == HALF_OPEN
+    breaker.record_failure(slow)
+    assert breaker.state == HALF_OPEN
+
+    breaker.record_success(trial)
+    assert breaker.state == CLOSED
+
+
+def test_closed_requests_are_not_trials(breaker):
+    assert breaker.before_request() is False
@@ -0,0 +1,138 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from conftest import notion_page, notion_todo
+from notion_mcp.utils.circuit_breaker import CircuitOpenError
+
+
+async def test_concurrent_identical_queries_share_one_request(make_client):
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=notion_page([notion_todo("a")]))
+
+    client = make_client(handler)
+    results = await asyncio.gather(*(client.fetch_todos(done=False) for _ in range(5)))
+
+    assert calls == 1
+    assert all([todo.id for todo in todos] == ["a"] for todos in results)
+    assert client.metrics.snapshot()["counters"]["coalesced_queries"] == 4
+
+
+async def test_mutation_invalidates_cached_query(make_client):
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        if request.url.path.endswith("/query"):
+            calls += 1
+            return httpx.Response(200, json=notion_page([notion_todo("a")]))
+        return httpx.Response(200, json=notion_todo("a", done=True))
+
+    client = make_client(handler)
+    await client.fetch_todos(done=False)
+    await client.fetch_todos(done=False)
+    assert calls == 1
+
+    await client.complete_todo("a")
+    await client.fetch_todos(done=False)
+    assert calls == 2
+
+
+async def test_schedule_index_follows_pagination(make_client):
+    pages = {
+        None: notion_page([notion_todo("a", "2024-05-01T10:00:00.000Z", "2024-05-01T11:00:00.000Z")],
+                          has_more=True, next_cursor="page-2"),
+        "page-2": notion_page([notion_todo("b", "2024-05-01T12:00:00.000Z", "2024-05-01T13:00:00.000Z")]),
+    }
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        cursor = json.loads(request.content).get("start_cursor")
+        return httpx.Response(200, json=pages[cursor])
+
+    client = make_client(handler)
+    schedule = await client.ensure_schedule_index()
+
+    assert len(schedule) == 2
+
+
+async def test_schedule_index_is_rebuilt_once_stale(make_client):
+    rows = [notion_todo("a", "2024-05-01T10:00:00.000Z", "2024-05-01T11:00:00.000Z")]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=notion_page(list(rows)))
+
+    client = make_client(handler)
+    assert len(await client.ensure_schedule_index()) == 1
+
+    # Deleted in Notion directly: invisible until the next full rebuild.
+    rows.clear()
+    assert len(await client.ensure_schedule_index()) == 1
+    client.schedule.expire()
+    assert len(await client.ensure_schedule_index()) == 0
+
+
+async def test_query_racing_a_mutation_does_not_revert_the_index(make_client):
+    old = notion_todo("a", "2024-05-01T10:00:00.000Z", "2024-05-01T11:00:00.000Z")
+    moved = notion_todo("a", "2024-05-01T14:00:00.000Z", "2024-05-01T15:00:00.000Z")
+    release_slow_query = asyncio.Event()
+    queries = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal queries
+        if request.method == "PATCH":
+            return httpx.Response(200, json=moved)
+        queries += 1
+        if queries > 1:
+            await release_slow_query.wait()
+        return httpx.Response(200, json=notion_page([old]))
+
+    client = make_client(handler)
+    schedule = await client.ensure_schedule_index()
+
+    slow_fetch = asyncio.create_task(client.fetch_todos(done=False))
+    await asyncio.sleep(0)
+    await client.change_todo_schedule(
+        "a", datetime(2024, 5, 1, 14, tzinfo=timezone.utc), datetime(2024, 5, 1, 15, tzinfo=timezone.utc))
+    release_slow_query.set()
+    await slow_fetch
+
+    assert [todo.id for todo in schedule.conflicts(
+        datetime(2024, 5, 1, 14, 15, tzinfo=timezone.utc),
+        datetime(2024, 5, 1, 14, 45, tzinfo=timezone.utc))] == ["a"]
+    assert schedule.conflicts(
+        datetime(2024, 5, 1, 10, 15, tzinfo=timezone.utc),
+        datetime(2024, 5, 1, 10, 45, tzinfo=timezone.utc)) == []
+
+
+async def test_open_circuit_falls_back_to_loaded_schedule_index(make_client):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=notion_page([
+            notion_todo("a", "2024-05-01T10:00:00.000Z", "2024-05-01T11:00:00.000Z")]))
+
+    client = make_client(handler)
+    assert len(await client.ensure_schedule_index()) == 1
+
+    client.schedule.expire()
+    for _ in range(client.breaker.failure_threshold):
+        client.breaker.record_failure()
+    schedule = await client.ensure_schedule_index()
+
+    assert len(schedule) == 1
+    assert client.metrics.snapshot()["counters"]["stale_cache_fallbacks"] == 1
+
+
+async def test_open_circuit_without_loaded_index_raises(make_client):
+    client = make_client(lambda request: httpx.Response(200, json=notion_page([])))
+    for _ in range(client.breaker.failure_threshold):
+        client.breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        await client.ensure_schedule_index()
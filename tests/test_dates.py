@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from notion_mcp.api import utils
+from notion_mcp.api.utils import (
+    localize, parse_local_datetime, parse_notion_date, parse_notion_datetime
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    parse_notion_date.cache_clear()
+    yield
+    parse_notion_date.cache_clear()
+
+
+@pytest.fixture
+def local_tz(monkeypatch):
+    def use(name: str) -> ZoneInfo:
+        tz = ZoneInfo(name)
+        monkeypatch.setattr(utils, "LOCAL_TZ", tz)
+        return tz
+
+    return use
+
+
+def hours(dt: datetime) -> float:
+    return dt.utcoffset() / timedelta(hours=1)
+
+
+def test_tokyo_uses_standard_offset_not_lmt(local_tz):
+    local_tz("Asia/Tokyo")
+    for value in ("2024-05-01T09:00:00", "1900-01-01T09:00:00"):
+        assert hours(parse_local_datetime(value)) == 9
+    assert parse_local_datetime("2024-05-01T09:00:00").isoformat() == "2024-05-01T09:00:00+09:00"
+    assert parse_notion_datetime("2024-05-01T00:00:00.000Z").isoformat() == "2024-05-01T09:00:00+09:00"
+
+
+def test_new_york_offsets_follow_dst(local_tz):
+    local_tz("America/New_York")
+    assert hours(parse_local_datetime("2024-01-15T09:00:00")) == -5
+    assert hours(parse_local_datetime("2024-07-15T09:00:00")) == -4
+
+
+def test_gap_time_resolves_to_pre_transition_offset(local_tz):
+    local_tz("America/New_York")
+    # 02:30 does not exist on 2024-03-10; fold=0 takes the EST offset,
+    # i.e. the instant shown as 03:30 EDT.
+    gap = parse_local_datetime("2024-03-10T02:30:00")
+    assert hours(gap) == -5
+    assert gap.astimezone(timezone.utc) == datetime(2024, 3, 10, 7, 30, tzinfo=timezone.utc)
+
+
+def test_repeated_hour_uses_fold(local_tz):
+    local_tz("America/New_York")
+    first = parse_local_datetime("2024-11-03T01:30:00")
+    assert first.fold == 0 and hours(first) == -4
+
+    second = localize(datetime(2024, 11, 3, 1, 30, fold=1))
+    assert hours(second) == -5
+    assert second - first == timedelta(0)
+    assert second.astimezone(timezone.utc) - first.astimezone(timezone.utc) == timedelta(hours=1)
+
+    # UTC timestamps from Notion land on the right side of the fold.
+    assert parse_notion_datetime("2024-11-03T05:30:00.000Z").fold == 0
+    later = parse_notion_datetime("2024-11-03T06:30:00.000Z")
+    assert (later.hour, later.minute, later.fold, hours(later)) == (1, 30, 1, -5)
+
+
+def test_localize_converts_aware_and_attaches_to_naive(local_tz):
+    tz = local_tz("Asia/Tokyo")
+    aware = localize(datetime(2024, 5, 1, 0, 0, tzinfo=timezone.utc))
+    assert aware.tzinfo is tz and aware.hour == 9
+
+    naive = localize(datetime(2024, 5, 1, 0, 0))
+    assert naive.tzinfo is tz and naive.hour == 0
+
+
+def test_date_only_values_are_local_midnight(local_tz):
+    local_tz("America/New_York")
+    assert parse_notion_datetime("2024-03-10").isoformat() == "2024-03-10T00:00:00-05:00"
+    assert parse_local_datetime("2024-07-01").isoformat() == "2024-07-01T00:00:00-04:00"
+
+
+@pytest.mark.parametrize("value", ["", "not-a-date", "2024-13-01", "2024-05-01T25:00:00Z"])
+def test_invalid_strings_return_none(value):
+    assert parse_notion_datetime(value) is None
+
+
+def test_parse_local_datetime_rejects_invalid_strings():
+    with pytest.raises(ValueError):
+        parse_local_datetime("not-a-date")
+
+
+def test_date_values_are_cached_but_timestamps_are_not():
+    assert parse_notion_date("2024-05-02") is parse_notion_date("2024-05-02")
+    assert parse_notion_date("bad") is None
+    assert parse_notion_date.cache_info().currsize == 2
+
+    parse_notion_datetime("2024-05-01T00:00:00.000Z")
+    assert parse_notion_date.cache_info().currsize == 2
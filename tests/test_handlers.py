@@ -0,0 +1,50 @@
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from notion_mcp.api import utils
+from notion_mcp.tools.handlers import (
+    _parse_minutes, handle_change_todo_schedule, handle_find_free_slot
+)
+
+
+@pytest.mark.parametrize("duration", ["abc", None, [30]])
+async def test_find_free_slot_rejects_non_integer_duration(duration):
+    with pytest.raises(ValueError, match="integer"):
+        await handle_find_free_slot({"duration_minutes": duration})
+
+
+async def test_find_free_slot_rejects_non_positive_duration():
+    with pytest.raises(ValueError, match="positive"):
+        await handle_find_free_slot({"duration_minutes": "0"})
+
+
+async def test_change_todo_schedule_requires_thirty_minutes():
+    with pytest.raises(ValueError, match="30 minutes"):
+        await handle_change_todo_schedule({
+            "task_id": "a",
+            "start_datetime": "2024-05-01T10:00:00",
+            "end_datetime": "2024-05-01T10:15:00",
+        })
+
+
+async def test_change_todo_schedule_measures_elapsed_time_across_dst(monkeypatch):
+    monkeypatch.setattr(utils, "LOCAL_TZ", ZoneInfo("America/New_York"))
+    # 01:45 -> 03:05 on 2024-03-10 spans 1:20 of wall clock but 20 real minutes.
+    with pytest.raises(ValueError, match="30 minutes"):
+        await handle_change_todo_schedule({
+            "task_id": "a",
+            "start_datetime": "2024-03-10T01:45:00",
+            "end_datetime": "2024-03-10T03:05:00",
+        })
+
+
+@pytest.mark.parametrize("duration", [30.5, True, False, "30.5"])
+async def test_find_free_slot_rejects_non_integral_duration(duration):
+    with pytest.raises(ValueError, match="integer"):
+        await handle_find_free_slot({"duration_minutes": duration})
+
+
+@pytest.mark.parametrize("duration", [30, 30.0, "30"])
+def test_parse_minutes_accepts_integral_values(duration):
+    assert _parse_minutes(duration) == 30
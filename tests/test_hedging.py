@@ -0,0 +1,127 @@
+import asyncio
+
+import httpx
+import pytest
+
+from conftest import notion_page
+from notion_mcp.utils.circuit_breaker import CircuitOpenError
+from notion_mcp.utils.hedging import HedgeBudget, LatencyTracker
+from notion_mcp.utils.rate_limit import RateLimiter
+
+SLOW = 0.5
+THRESHOLD = 0.05
+
+
+def scripted(*responses):
+    """Mock Notion answering the n-th request after the n-th (delay, status)."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        delay, status = responses[len(calls)]
+        calls.append(request)
+        await asyncio.sleep(delay)
+        return httpx.Response(status, json=notion_page([]) if status == 200 else {})
+
+    return handler, calls
+
+
+@pytest.fixture
+def hedged_client(make_client):
+    def factory(*responses):
+        handler, calls = scripted(*responses)
+        client = make_client(handler)
+        client.latency = LatencyTracker(initial_delay=THRESHOLD)
+        return client, calls
+
+    return factory
+
+
+async def query(client):
+    return await client._request("POST", "/databases/db/query", hedge=True, json={})
+
+
+async def test_fast_primary_is_not_hedged(hedged_client):
+    client, calls = hedged_client((0, 200))
+    await query(client)
+
+    assert len(calls) == 1
+    assert "hedged_requests" not in client.metrics.snapshot()["counters"]
+
+
+async def test_hedge_wins_over_slow_primary_and_loser_is_sampled(hedged_client):
+    client, calls = hedged_client((SLOW, 200), (0, 200))
+    started = asyncio.get_running_loop().time()
+    await query(client)
+
+    assert asyncio.get_running_loop().time() - started < SLOW
+    assert len(calls) == 2
+    counters = client.metrics.snapshot()["counters"]
+    assert counters["hedged_requests"] == 1
+    assert counters["hedge_wins"] == 1
+    # The cancelled primary's elapsed time is kept as a sample.
+    assert len(client.latency._samples) == 2
+
+
+async def test_error_status_loses_to_slower_success(hedged_client):
+    client, calls = hedged_client((SLOW, 200), (0, 503))
+    await query(client)
+
+    assert len(calls) == 2
+    assert "hedge_wins" not in client.metrics.snapshot()["counters"]
+    assert client.breaker.state == "closed"
+
+
+async def test_both_failing_raises_and_counts_against_breaker(hedged_client):
+    client, _ = hedged_client((SLOW, 503), (0, 503))
+    with pytest.raises(httpx.HTTPStatusError):
+        await query(client)
+    assert client.breaker._failures == 1
+
+
+async def test_hedge_budget_caps_hedges(hedged_client):
+    client, calls = hedged_client((SLOW, 200))
+    client.hedge_budget = HedgeBudget(ratio=0)
+    client.hedge_budget.withdraw()
+    await query(client)
+
+    assert len(calls) == 1
+    assert client.metrics.snapshot()["counters"]["hedges_over_budget"] == 1
+
+
+def test_hedge_budget_allows_ratio_of_requests():
+    budget = HedgeBudget(ratio=0.25)
+    budget.withdraw()
+    allowed = 0
+    for _ in range(100):
+        budget.deposit()
+        allowed += budget.withdraw()
+    assert allowed == 25
+
+
+async def test_rate_limiter_wait_does_not_trigger_hedge(hedged_client):
+    client, calls = hedged_client((0.01, 200))
+    client.rate_limiter = RateLimiter(rate=1 / (THRESHOLD * 4), burst=1)
+    await client.rate_limiter.acquire()
+
+    await query(client)
+    assert len(calls) == 1
+
+
+async def test_open_circuit_rejects_without_sending(hedged_client):
+    client, calls = hedged_client()
+    for _ in range(client.breaker.failure_threshold):
+        client.breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        await query(client)
+    assert calls == []
+
+
+async def test_only_successful_reads_feed_the_hedge_threshold(hedged_client):
+    client, _ = hedged_client((0, 200), (0, 200), (0, 503))
+    await client._request("PATCH", "/pages/a", json={})
+    await query(client)
+    with pytest.raises(httpx.HTTPStatusError):
+        await query(client)
+
+    assert len(client.latency._samples) == 1
@@ -0,0 +1,54 @@
+from notion_mcp.utils.cache import QueryCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_fresh_value_and_hides_expired_one():
+    clock = FakeClock()
+    cache = QueryCache(ttl=10, clock=clock)
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+
+    clock.now = 10
+    assert cache.get("k") is None
+    assert cache.get("k", allow_stale=True) == "v"
+
+
+def test_stale_entries_are_dropped_after_stale_ttl():
+    clock = FakeClock()
+    cache = QueryCache(ttl=10, stale_ttl=5, clock=clock)
+    cache.set("k", "v")
+
+    clock.now = 15
+    assert cache.get("k", allow_stale=True) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_set_from_before_invalidation_is_dropped():
+    cache = QueryCache()
+    generation = cache.generation
+    cache.invalidate()
+    cache.set("k", "v", generation=generation)
+    assert cache.get("k") is None
+
+    cache.set("k", "v", generation=cache.generation)
+    assert cache.get("k") == "v"
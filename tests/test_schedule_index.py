@@ -0,0 +1,131 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from notion_mcp.api.parsers import parse_date_end_property
+from notion_mcp.models.todo import Todo
+from notion_mcp.utils.schedule_index import ScheduleIndex
+
+BASE = datetime(2024, 5, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def make_todo(todo_id: str, start: int, end: int, done: bool = False) -> Todo:
+    return Todo(
+        id=todo_id,
+        name=f"Task {todo_id}",
+        date=BASE + timedelta(minutes=start),
+        date_end=BASE + timedelta(minutes=end),
+        created=BASE,
+        done=done,
+    )
+
+
+def at(minutes: int) -> datetime:
+    return BASE + timedelta(minutes=minutes)
+
+
+def test_conflicts_report_overlapping_open_todos_only():
+    index = ScheduleIndex()
+    index.build([
+        make_todo("a", 0, 60),
+        make_todo("b", 60, 90),
+        make_todo("c", 30, 45, done=True),
+        make_todo("d", 120, 180),
+    ])
+
+    assert {todo.id for todo in index.conflicts(at(30), at(70))} == {"a", "b"}
+    assert index.conflicts(at(90), at(120)) == []
+    assert [todo.id for todo in index.conflicts(at(0), at(30), exclude_id="a")] == []
+
+
+def test_find_free_slot_skips_busy_blocks_and_short_gaps():
+    index = ScheduleIndex()
+    index.build([
+        make_todo("a", 0, 60),
+        make_todo("b", 50, 90),
+        make_todo("c", 100, 150),
+        make_todo("d", 200, 230),
+    ])
+
+    assert index.find_free_slot(at(10), timedelta(minutes=10)) == (at(90), at(100))
+    assert index.find_free_slot(at(10), timedelta(minutes=30)) == (at(150), at(180))
+    assert index.find_free_slot(at(10), timedelta(minutes=60)) == (at(230), at(290))
+    assert index.find_free_slot(at(-30), timedelta(minutes=30)) == (at(-30), at(0))
+
+
+def test_updates_move_and_drop_todos():
+    index = ScheduleIndex()
+    index.build([make_todo("a", 0, 60)])
+
+    index.update([make_todo("a", 120, 180)])
+    assert index.conflicts(at(0), at(60)) == []
+    assert [todo.id for todo in index.conflicts(at(130), at(140))] == ["a"]
+
+    index.update([make_todo("a", 120, 180, done=True)])
+    assert len(index) == 0
+
+
+def test_index_goes_stale_after_ttl():
+    now = [0.0]
+    index = ScheduleIndex(ttl=60, clock=lambda: now[0])
+    assert index.is_stale()
+
+    index.build([])
+    assert not index.is_stale()
+    now[0] = 60
+    assert index.is_stale()
+
+    index.build([])
+    index.expire()
+    assert index.is_stale()
+
+
+def test_date_only_range_end_covers_the_last_day():
+    props = {"Date": {"date": {"start": "2024-05-01", "end": "2024-05-02"}}}
+    end = parse_date_end_property(props, "Date")
+    assert (end.year, end.month, end.day, end.hour) == (2024, 5, 3, 0)
+
+    props = {"Date": {"date": {"start": "2024-05-01T10:00:00.000+09:00",
+                               "end": "2024-05-01T11:00:00.000+09:00"}}}
+    assert parse_date_end_property(props, "Date").hour == 11
+
+
+def test_matches_brute_force_on_random_schedules():
+    rng = random.Random(27)
+    for _ in range(300):
+        todos = []
+        for i in range(rng.randint(0, 20)):
+            start = rng.randint(0, 300)
+            todos.append(make_todo(str(i), start, start + rng.randint(1, 60),
+                                   done=rng.random() < 0.2))
+        index = ScheduleIndex()
+        index.build(todos)
+        busy = [todo for todo in todos if not todo.done]
+
+        query_start = rng.randint(-10, 380)
+        length = rng.randint(1, 90)
+        query_end = query_start + length
+
+        expected = {todo.id for todo in busy
+                    if todo.date < at(query_end) and todo.date_end > at(query_start)}
+        assert {todo.id for todo in index.conflicts(at(query_start), at(query_end))} == expected
+
+        slot = query_start
+        while any(todo.date < at(slot + length) and todo.date_end > at(slot) for todo in busy):
+            slot += 1
+        assert index.find_free_slot(at(query_start), timedelta(minutes=length)) == \
+            (at(slot), at(slot + length))
+
+
+def test_update_without_interval_changes_skips_rebuild(monkeypatch):
+    index = ScheduleIndex()
+    index.build([make_todo("a", 0, 60), make_todo("b", 90, 120)])
+    rebuilds = []
+    monkeypatch.setattr(index, "_rebuild", lambda: rebuilds.append(1))
+
+    renamed = make_todo("a", 0, 60).model_copy(update={"name": "Renamed"})
+    index.update([renamed, make_todo("c", 0, 30, done=True)])
+    assert rebuilds == []
+    assert index.conflicts(at(0), at(10))[0].name == "Renamed"
+
+    index.update([make_todo("b", 100, 120)])
+    assert rebuilds == [1]